@@ -1,10 +1,37 @@
+import asyncio
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers import routes, upload
+from services.llm_tts import SimplyLegal_main
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # TTS and PDF/DOCX parsing are offloaded with asyncio.to_thread, which
+    # uses the loop's default executor — size it explicitly
+    executor = ThreadPoolExecutor(max_workers=int(os.getenv("THREADPOOL_SIZE", "32")))
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    # Built here rather than at import so each worker initializes its LLM
+    # client and TTS engine once, after the server is up
+    app.state.model = SimplyLegal_main()
+    # Load the LLM in the background; startup does not wait for it
+    warmup = asyncio.create_task(app.state.model.warmup())
+    yield
+    warmup.cancel()
+    await app.state.model.aclose()
+    executor.shutdown(wait=False)
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:5173").split(",")
 
@@ -21,4 +48,19 @@ app.include_router(upload.router)
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    # Separate processes let CPU-bound TTS and PDF parsing use every core.
+    # Each worker builds its own SimplyLegal_main in the lifespan.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    if workers > 1 and not os.getenv("AUDIO_CACHE_DIR"):
+        logger.warning("WEB_CONCURRENCY > 1 without AUDIO_CACHE_DIR: /api/audio/{id} may hit a worker that does not hold the audio")
+    # Cap concurrent connections so a burst of uploads cannot exhaust memory;
+    # requests beyond the cap get a 503
+    limit = os.getenv("LIMIT_CONCURRENCY")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        reload=workers == 1,  # uvicorn cannot reload with multiple workers
+        workers=workers,
+        limit_concurrency=int(limit) if limit else None,
+    )
\ No newline at end of file
@@ -0,0 +1,17 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+class RedFlag(BaseModel):
+    quote: str = Field(..., description="Exact or near-exact quote of the risky clause")
+    risk: str = Field(..., description="Plain-language explanation of the hidden risk")
+    severity: Literal["high", "medium", "low"]
+    worst_case: str = Field(..., description="Realistic worst-case scenario for the user")
+
+class LLMResponse(BaseModel):
+    text: str = Field(..., description="Simplified translation")
+    red_flags: list[RedFlag] = Field(default_factory=list)
+    chunks_processed: int = Field(1, description="Number of chunks the input was split into")
+    status: str = "success"
+    audio_id: str | None = Field(None, description="Id for GET /api/audio/{audio_id}")
+    audio: str | None = Field(None, description="Base64-encoded WAV (only with inline_audio=true)")
@@ -1,13 +1,32 @@
-import base64
+import json
 import logging
+import os
 
-from fastapi import APIRouter, HTTPException, status
+try:
+    import pybase64 as base64  # SIMD-accelerated, same API as the stdlib module
+except ImportError:
+    import base64
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from services.audio_store import AudioStore
 from services.llm_tts import SimplyLegal_main
 from models.LLMRequest import LLMRequest
+from models.LLMResponse import LLMResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["api"])
-model = SimplyLegal_main()
+audio_store = AudioStore(
+    ttl=int(os.getenv("AUDIO_TTL", "1800")),
+    directory=os.getenv("AUDIO_CACHE_DIR") or None,
+)
+
+async def get_model(request: Request) -> SimplyLegal_main:
+    """
+    The shared SimplyLegal_main instance created in the app lifespan. Async
+    so FastAPI calls it inline instead of dispatching it to the threadpool.
+    """
+    return request.app.state.model
 
 @router.get("/health")
 async def health_check():
@@ -18,16 +37,30 @@ async def health_check():
 async def root():
     return {"message": "SimplyLegal API - Translate complex text to plain language"}
 
-@router.post("/llm_output", response_description="Translated text and audio")
-async def get_llm_output(request: LLMRequest):
+# With a response_model, FastAPI validates and serializes the result in
+# pydantic-core (Rust) straight to JSON bytes instead of going through
+# jsonable_encoder + json.dumps
+@router.post(
+    "/llm_output",
+    response_model=LLMResponse,
+    response_model_exclude_none=True,
+    response_description="Translated text and audio",
+)
+async def get_llm_output(
+    request: LLMRequest,
+    inline_audio: bool = False,
+    model: SimplyLegal_main = Depends(get_model),
+):
     """
     Translate complex text (e.g., legal documents) to plain language and convert to audio.
 
     - **text**: The text to translate (1-5000 characters)
+    - **inline_audio**: Query flag; embed the audio as Base64 instead of returning an id
 
     Returns:
     - **text**: Simplified translation
-    - **audio**: Base64-encoded WAV audio file
+    - **audio_id**: Id of the WAV audio, fetch it from `/api/audio/{audio_id}`
+    - **audio**: Base64-encoded WAV audio file (only with `inline_audio=true`)
     """
     try:
         logger.info(f"Processing request with text length: {len(request.text)}")
@@ -42,7 +75,7 @@ async def get_llm_output(request: LLMRequest):
 
         # Process the text
         try:
-            result = model.process_text(text)
+            result = await model.process_text(text)
         except Exception as service_error:
             logger.error(f"Service error: {service_error}")
             raise HTTPException(
@@ -57,25 +90,30 @@ async def get_llm_output(request: LLMRequest):
                 detail="Failed to process text or generate audio"
             )
 
-        # Encode audio to base64
-        try:
-            audio_b64 = base64.b64encode(result["audio"]).decode("utf-8")
-        except Exception as e:
-            logger.error(f"Error encoding audio: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to encode audio output"
-            )
-
-        logger.info("Request processed successfully")
-        return {
+        response = {
             "text":             result["text"],
             "red_flags":        result.get("red_flags", []),
-            "audio":            audio_b64,
             "chunks_processed": result.get("chunks_processed", 1),
             "status":           "success",
         }
 
+        # Audio is served raw from /audio/{id} by default; Base64 would add
+        # ~33% to the payload plus encode/decode work on both ends
+        if inline_audio:
+            try:
+                response["audio"] = base64.b64encode(result["audio"]).decode("ascii")
+            except Exception as e:
+                logger.error(f"Error encoding audio: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to encode audio output"
+                )
+        else:
+            response["audio_id"] = audio_store.put(result["audio"])
+
+        logger.info("Request processed successfully")
+        return response
+
     except HTTPException:
         raise
     except Exception as e:
@@ -83,4 +121,55 @@ async def get_llm_output(request: LLMRequest):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred. Please try again."
-        )
\ No newline at end of file
+        )
+
+@router.post("/llm_output/stream", response_description="Server-Sent Events stream")
+async def stream_llm_output(request: LLMRequest, model: SimplyLegal_main = Depends(get_model)):
+    """
+    Streaming version of /llm_output, sent as Server-Sent Events so the client
+    sees output as soon as the model starts generating.
+
+    Each event is a `data: {json}` line whose **type** is one of:
+    - **delta**: raw model output for chunk `index`
+    - **text**: decoded `simplified_text` of chunk `index`, as it is generated
+    - **chunk**: parsed `simplified_text` / `red_flags` for chunk `index`
+    - **done**: same fields as /llm_output, with the audio as `audio_id`
+    - **error**: processing failed; `detail` holds the reason
+    """
+    text = request.text.strip()
+    if not text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Text input cannot be empty"
+        )
+
+    logger.info(f"Streaming request with text length: {len(text)}")
+
+    async def events():
+        try:
+            async for event in model.stream_text(text):
+                if event["type"] == "done":
+                    event["audio_id"] = audio_store.put(event.pop("audio"))
+                    event["status"]   = "success"
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming error: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'detail': str(e)})}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/audio/{audio_id}", response_description="WAV audio")
+async def get_audio(audio_id: str):
+    """Return the WAV audio generated by /llm_output, while it has not expired."""
+    audio = audio_store.get(audio_id)
+    if audio is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audio not found or expired"
+        )
+    return Response(content=audio, media_type="audio/wav")
@@ -1,23 +1,96 @@
+import asyncio
 import io
 import logging
+import shutil
+import subprocess
+import zipfile
 from pathlib import Path
+from xml.etree import ElementTree
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, File, HTTPException, Request, Response, UploadFile, status
+from fastapi.routing import APIRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api", tags=["upload"])
 
 _MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+# Room for the multipart boundaries and part headers around the file
+_MAX_REQUEST_SIZE = _MAX_FILE_SIZE + 64 * 1024
+# Below this size, spawning pdftotext costs more than PyMuPDF's extraction
+_PDFTOTEXT_MIN_SIZE = 1024 * 1024  # 1 MB
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+# Paragraph children whose w:r children still belong to the paragraph itself
+_RUN_WRAPPERS = {f"{_W}hyperlink", f"{_W}ins", f"{_W}smartTag"}
 _ALLOWED_EXTENSIONS = {".txt", ".pdf", ".docx"}
 
 
+class _SizeLimitedRoute(APIRoute):
+    """
+    Rejects a request whose Content-Length is over the limit before FastAPI
+    parses the multipart body, which would spool the whole upload first.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def size_limited_handler(request: Request) -> Response:
+            length = request.headers.get("content-length", "")
+            if length.isdigit() and int(length) > _MAX_REQUEST_SIZE:
+                raise HTTPException(
+                    status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                    detail="File too large. Maximum is 10 MB.",
+                )
+            return await handler(request)
+
+        return size_limited_handler
+
+
+router = APIRouter(prefix="/api", tags=["upload"], route_class=_SizeLimitedRoute)
+
+
 def _extract_pdf(content: bytes) -> str:
+    if len(content) >= _PDFTOTEXT_MIN_SIZE and shutil.which("pdftotext"):
+        text = _extract_pdf_pdftotext(content)
+        if text is not None:
+            return text
+    try:
+        import pymupdf
+    except ImportError:
+        return _extract_pdf_pypdf(content)
+    doc = pymupdf.open(stream=content, filetype="pdf")
+    try:
+        return "\n\n".join(page.get_text("text") for page in doc).strip()
+    finally:
+        doc.close()
+
+
+def _extract_pdf_pdftotext(content: bytes) -> str | None:
+    """Dump the whole document with Poppler's pdftotext; None if it fails."""
+    try:
+        proc = subprocess.run(
+            ["pdftotext", "-enc", "UTF-8", "-", "-"],
+            input=content,
+            capture_output=True,
+            timeout=60,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"pdftotext failed, falling back to PyMuPDF: {e}")
+        return None
+    # Pages are separated by form feeds
+    pages = proc.stdout.decode("utf-8", errors="replace").split("\f")
+    return "\n\n".join(pages).strip()
+
+
+def _extract_pdf_pypdf(content: bytes) -> str:
+    """Pure-Python fallback for when PyMuPDF is not installed."""
     try:
         from pypdf import PdfReader
     except ImportError:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="PDF support not installed. Run: pip install pypdf",
+            detail="PDF support not installed. Run: pip install pymupdf",
         )
     reader = PdfReader(io.BytesIO(content))
     pages = [page.extract_text() or "" for page in reader.pages]
@@ -25,18 +98,54 @@ def _extract_pdf(content: bytes) -> str:
 
 
 def _extract_docx(content: bytes) -> str:
+    # Read the body XML straight out of the .docx zip in one pass, instead of
+    # materializing python-docx's object model for every paragraph and run
     try:
-        from docx import Document
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="DOCX support not installed. Run: pip install python-docx",
-        )
-    doc = Document(io.BytesIO(content))
-    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError("not a valid .docx file")
+
+    paragraphs = []
+    for para in _iter_paragraphs(root):
+        parts = []
+        for run in _paragraph_runs(para):
+            for node in run:
+                if node.tag == f"{_W}t":
+                    parts.append(node.text or "")
+                elif node.tag == f"{_W}tab":
+                    parts.append("\t")
+                elif node.tag in (f"{_W}br", f"{_W}cr"):
+                    parts.append("\n")
+        text = "".join(parts)
+        if text.strip():
+            paragraphs.append(text)
     return "\n\n".join(paragraphs).strip()
 
 
+def _iter_paragraphs(element):
+    """
+    Every w:p in document order, including those in tables and text boxes.
+    mc:Fallback holds a legacy copy of content already present in the
+    matching mc:Choice (e.g. a text box), so it is skipped.
+    """
+    for child in element:
+        if child.tag == _MC_FALLBACK:
+            continue
+        if child.tag == f"{_W}p":
+            yield child
+        yield from _iter_paragraphs(child)
+
+
+def _paragraph_runs(para):
+    """The paragraph's own runs; runs of nested paragraphs (text boxes) are theirs."""
+    for child in para:
+        if child.tag == f"{_W}r":
+            yield child
+        elif child.tag in _RUN_WRAPPERS:
+            yield from child.iterfind(f"{_W}r")
+
+
 @router.post("/upload", response_description="Extracted text from uploaded file")
 async def upload_file(file: UploadFile = File(...)):
     """
@@ -61,6 +170,14 @@ async def upload_file(file: UploadFile = File(...)):
             detail=f"Unsupported file type '{ext}'. Allowed: .txt, .pdf, .docx",
         )
 
+    # Oversized requests with a Content-Length never get here (see
+    # _SizeLimitedRoute); this catches chunked uploads, which have none
+    if file.size is not None and file.size > _MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"File too large ({file.size // 1024} KB). Maximum is 10 MB.",
+        )
+
     # Read entire file into memory (no disk write)
     content = await file.read()
 
@@ -70,22 +187,18 @@ async def upload_file(file: UploadFile = File(...)):
             detail="Uploaded file is empty",
         )
 
-    if len(content) > _MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large ({len(content) // 1024} KB). Maximum is 10 MB.",
-        )
-
     logger.info(f"Processing upload: {file.filename} ({len(content)} bytes, type={ext})")
 
-    # Extract text based on file type — all in-memory, no temp files
+    # Extract text based on file type — all in-memory, no temp files.
+    # PDF/DOCX parsing is CPU-bound, so it runs in a worker thread to keep
+    # the event loop free for other requests.
     try:
         if ext == ".txt":
             text = content.decode("utf-8", errors="replace")
         elif ext == ".pdf":
-            text = _extract_pdf(content)
+            text = await asyncio.to_thread(_extract_pdf, content)
         elif ext == ".docx":
-            text = _extract_docx(content)
+            text = await asyncio.to_thread(_extract_docx, content)
         else:
             # Unreachable due to extension check above, but satisfies type checkers
             raise HTTPException(status_code=400, detail="Unsupported file type")
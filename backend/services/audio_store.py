@@ -0,0 +1,72 @@
+import logging
+import secrets
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class AudioStore:
+    """
+    Short-lived in-memory store for generated audio.
+
+    /llm_output hands the client an id instead of inlining the WAV, and the
+    client fetches the raw bytes from /audio/{id}. Entries expire after `ttl`
+    seconds, and the oldest are evicted once `max_bytes` is exceeded.
+
+    With several uvicorn workers the follow-up GET can land on a different
+    process, so a `directory` can be given to keep the audio in a diskcache
+    shared by all workers instead.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1800,
+        max_bytes: int = 256 * 1024 * 1024,
+        directory: str | None = None,
+    ):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._total = 0
+        self._disk = None
+
+        if directory:
+            try:
+                import diskcache
+            except ImportError:
+                logger.warning("diskcache not installed; keeping audio in memory. Run: pip install diskcache")
+            else:
+                self._disk = diskcache.Cache(directory, size_limit=max_bytes)
+
+    def put(self, audio: bytes) -> str:
+        """Store audio bytes and return the id to fetch them with."""
+        audio_id = secrets.token_urlsafe(16)
+        if self._disk is not None:
+            self._disk.set(audio_id, audio, expire=self.ttl)
+            return audio_id
+
+        self._evict(time.monotonic())
+        self._items[audio_id] = (time.monotonic() + self.ttl, audio)
+        self._total += len(audio)
+        while self._total > self.max_bytes and len(self._items) > 1:
+            self._pop_oldest()
+        return audio_id
+
+    def get(self, audio_id: str) -> bytes | None:
+        """Return the stored audio, or None if unknown or expired."""
+        if self._disk is not None:
+            return self._disk.get(audio_id)
+
+        self._evict(time.monotonic())
+        item = self._items.get(audio_id)
+        return item[1] if item else None
+
+    def _evict(self, now: float) -> None:
+        # Entries are never refreshed, so insertion order is expiry order
+        while self._items and next(iter(self._items.values()))[0] <= now:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        _, (_, audio) = self._items.popitem(last=False)
+        self._total -= len(audio)
@@ -1,18 +1,78 @@
+import asyncio
+import io
 import os
 import re
-import json
+import sys
+import threading
+import wave
 from dotenv import load_dotenv
 import logging
 
+try:
+    from orjson import loads as _json_loads  # native parser; accepts str like the stdlib
+except ImportError:
+    from json import loads as _json_loads
+
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import groq
+import httpx
 import ollama
-from groq import Groq
+from groq import AsyncGroq
 import pyttsx3
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 import tempfile
-from services.text_chunker import TextChunker
 
+# Before importing the services below, which read their settings at import
 load_dotenv()
+
+from services.result_cache import ResultCache
+from services.text_chunker import TextChunker
+
 logger = logging.getLogger(__name__)
 
+_LLM_TIMEOUT = int(os.getenv("LLM_TIMEOUT", "60"))
+_GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+_OLLAMA_MODEL = os.getenv("LLM_MODEL", "llama3.2:latest")
+
+# pyttsx3 can only write audio to a path. On Linux (espeak) that path is a
+# FIFO read straight into memory; elsewhere it is a temp file, placed on a
+# RAM-backed tmpfs where one exists so the round-trip never touches the disk.
+_TTS_USE_FIFO = sys.platform.startswith("linux") and hasattr(os, "mkfifo")
+_TTS_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_FENCE_RE = re.compile(r"```(?:json)?\s*")
+_TEXT_FIELD_RE = re.compile(r'"simplified_text"\s*:\s*"')
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Rate limits, 5xx responses and failures to connect; not other 4xx.
+
+    Read timeouts are not retried: the request may still be generating on
+    the server, and another attempt would wait the full timeout again.
+    """
+    if isinstance(exc, groq.APITimeoutError):
+        # Groq reports every timeout this way; only a connect timeout is safe
+        return isinstance(exc.__cause__, httpx.ConnectTimeout)
+    if isinstance(exc, (groq.APIConnectionError, httpx.ConnectError, httpx.ConnectTimeout,
+                        httpx.RemoteProtocolError, ConnectionError)):
+        return True
+    # groq.APIStatusError and ollama.ResponseError both carry the HTTP status
+    status_code = getattr(exc, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+# Transient provider errors usually clear up within a second, so retry a
+# couple of times with jittered backoff before surfacing a 503
+_llm_retry = retry(
+    retry=retry_if_exception(_is_transient),
+    stop=stop_after_attempt(int(os.getenv("LLM_MAX_ATTEMPTS", "3"))),
+    wait=wait_exponential_jitter(multiplier=0.2, max=2.0),
+    reraise=True,
+)
+
 # ---------------------------------------------------------------------------
 # System prompt — contract risk auditor persona with structured JSON output:
 #   simplified_text  : plain-English translation
@@ -22,11 +82,11 @@ _DEFAULT_SYSTEM_PROMPT = """\
 You are a contract risk auditor trained to identify hidden, asymmetric, or \
 user-unfriendly clauses.
 
-Analyze the following contract text and:
+Analyze the contract text you are given and:
 
-1. Identify the language of the text. Throughout the simplification process, keep the original language. \
-    Ex: If the text is in Spanish, respond in Spanish. If the text is in English, respond in English. \
-    Do not translate the text to another language.
+1. Identify the language of the text and keep it throughout: if the text is \
+in Spanish, respond in Spanish; if it is in English, respond in English. \
+Do not translate it into another language.
 2. Translate any complex legal jargon into simple, easy-to-understand \
 modern text in the original language.
 3. Identify all potential red flags, assuming the reader is an individual user or \
@@ -41,7 +101,7 @@ small business with less bargaining power.
    - Allow termination without notice
    - Create financial traps (auto-renewal, fees, penalties)
 
-Be conservative: if a clause could reasonably be harmful, mark it. 
+Be conservative: if a clause could reasonably be harmful, mark it.
 
 Respond with ONLY a valid JSON object — no markdown, no explanation, \
 no text outside the JSON:
@@ -65,10 +125,100 @@ if triggered
 - "low":    worth reviewing but common in contracts; low probability of harm
 
 If there are no red flags use: "red_flags": []
-Reply in the original language only. Output ONLY the valid JSON object, nothing else.\
+"""
+
+# ---------------------------------------------------------------------------
+# Split prompts, used when SIMPLIFY_MODEL / AUDIT_MODEL route the two halves
+# of the job to different models
+# ---------------------------------------------------------------------------
+_SIMPLIFY_PROMPT = """\
+You rewrite legal text for readers without legal training.
+
+1. Identify the language of the text and keep it throughout: if the text is \
+in Spanish, respond in Spanish; if it is in English, respond in English. \
+Do not translate it into another language.
+2. Translate any complex legal jargon into simple, easy-to-understand \
+modern text in the original language. Cover the full text.
+
+Respond with ONLY a valid JSON object — no markdown, no explanation, \
+no text outside the JSON:
+{
+  "simplified_text": "<plain-original-language translation of the full text>"
+}
+"""
+
+_AUDIT_PROMPT = """\
+You are a contract risk auditor trained to identify hidden, asymmetric, or \
+user-unfriendly clauses.
+
+Identify all potential red flags in the contract text you are given, assuming the \
+reader is an individual user or small business with less bargaining power. \
+Highlight clauses that:
+   - Limit legal rights
+   - Shift liability
+   - Allow unilateral changes
+   - Cap damages
+   - Remove court access
+   - Broadly license data/IP
+   - Allow termination without notice
+   - Create financial traps (auto-renewal, fees, penalties)
+
+Be conservative: if a clause could reasonably be harmful, mark it. \
+Write "risk" and "worst_case" in the language of the contract text.
+
+Respond with ONLY a valid JSON object — no markdown, no explanation, \
+no text outside the JSON:
+{
+  "red_flags": [
+    {
+      "quote":      "<exact or near-exact quote of the risky clause>",
+      "risk":       "<plain-original-language explanation of the hidden risk>",
+      "severity":   "high",
+      "worst_case": "<realistic worst-case scenario for the user>"
+    }
+  ]
+}
 
+Severity levels:
+- "high":   severely limits rights, imposes unlimited liability, waives legal \
+recourse, or may be illegal
+- "medium": meaningfully one-sided, creates significant financial or legal risk \
+if triggered
+- "low":    worth reviewing but common in contracts; low probability of harm
+
+If there are no red flags use: "red_flags": []
 """
 
+# Same shapes as above, for providers that constrain decoding to a schema
+_RED_FLAGS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "quote":      {"type": "string"},
+            "risk":       {"type": "string"},
+            "severity":   {"type": "string", "enum": ["high", "medium", "low"]},
+            "worst_case": {"type": "string"},
+        },
+        "required": ["quote", "risk", "severity", "worst_case"],
+    },
+}
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"simplified_text": {"type": "string"}, "red_flags": _RED_FLAGS_SCHEMA},
+    "required": ["simplified_text", "red_flags"],
+}
+_SIMPLIFY_SCHEMA = {
+    "type": "object",
+    "properties": {"simplified_text": {"type": "string"}},
+    "required": ["simplified_text"],
+}
+_AUDIT_SCHEMA = {
+    "type": "object",
+    "properties": {"red_flags": _RED_FLAGS_SCHEMA},
+    "required": ["red_flags"],
+}
+
 
 class SimplyLegal_main:
 
@@ -78,47 +228,204 @@ class SimplyLegal_main:
 
         # Allow full prompt override via env, otherwise use the structured default
         self.system_prompt = _DEFAULT_SYSTEM_PROMPT
+        # Ask the provider to guarantee a JSON reply (Groq JSON mode, Ollama
+        # schema-constrained output) rather than relying on the prompt alone
+        self.json_mode = os.getenv("LLM_JSON_MODE", "true").lower() == "true"
+
+        self.llm_timeout = _LLM_TIMEOUT
+        self._http: httpx.AsyncClient | None = None
+
+        # Generations can be slow, but a connect that takes more than a few
+        # seconds is a dead host: fail fast and let _llm_retry try again.
+        # Idle connections are kept long enough to bridge the gap between
+        # user requests, so those don't pay for a new TLS handshake.
+        http_timeout = httpx.Timeout(self.llm_timeout, connect=5)
+        http_limits = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30)
 
         # Groq takes priority when an API key is configured
         groq_key = os.getenv("GROQ_API_KEY")
         if groq_key:
             self.provider = "groq"
-            self.groq_client = Groq(api_key=groq_key)
-            self.groq_model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+            # One pooled HTTP/2 connection set for the process lifetime, so
+            # concurrent chunk calls multiplex instead of re-handshaking TLS
+            self._http = httpx.AsyncClient(http2=True, timeout=http_timeout, limits=http_limits)
+            # Retries are handled by _llm_retry; don't stack the SDK's on top
+            self.groq_client = AsyncGroq(api_key=groq_key, http_client=self._http, max_retries=0)
+            self.groq_model = _GROQ_MODEL
             logger.info(f"LLM provider: Groq ({self.groq_model})")
         else:
             self.provider = "ollama"
-            self.ollama_model = os.getenv("LLM_MODEL", "llama3.2:latest")
-            self.llm_timeout = int(os.getenv("LLM_TIMEOUT", "60"))
+            self.ollama_model = _OLLAMA_MODEL
+            # How long Ollama keeps the model loaded after each request, so
+            # quiet periods between users don't trigger a reload
+            self.ollama_keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "24h")
+            # AsyncClient keeps a single connection pool for its lifetime
+            self.ollama_client = ollama.AsyncClient(
+                host=os.getenv("LLM_BASE_URL") or None,
+                timeout=http_timeout,
+                limits=http_limits,
+            )
+            # ollama.AsyncClient has no close(); keep its httpx client so
+            # aclose() can shut the pool down like Groq's
+            self._http = self.ollama_client._client
             logger.info(f"LLM provider: Ollama ({self.ollama_model})")
 
+        # Optionally split each chunk into two concurrent calls: a small, fast
+        # (e.g. Q4-quantized) model rewrites the text while a larger one only
+        # audits it for red flags. Unset, one model does both in one call.
+        model = self.groq_model if self.provider == "groq" else self.ollama_model
+        self.simplify_model = os.getenv("SIMPLIFY_MODEL") or model
+        self.audit_model = os.getenv("AUDIT_MODEL") or model
+        self.split_passes = self.simplify_model != model or self.audit_model != model
+        if self.split_passes:
+            logger.info(f"Split passes: simplify with {self.simplify_model}, audit with {self.audit_model}")
+
+        # Upper bound on concurrent in-flight LLM calls, so that fanning out a
+        # long document does not trip provider rate limits. Ollama batches
+        # up to OLLAMA_NUM_PARALLEL requests server-side, so default to that
+        # many concurrent chunks to keep its batch full.
+        default_concurrency = "4"
+        if self.provider == "ollama":
+            default_concurrency = os.getenv("OLLAMA_NUM_PARALLEL", default_concurrency)
+        self._llm_semaphore = asyncio.Semaphore(int(os.getenv("LLM_CONCURRENCY", default_concurrency)))
+
+        # Translations keyed by provider/model/prompt/chunk; repeated clauses
+        # skip the LLM entirely
+        self.cache = ResultCache(
+            maxsize=int(os.getenv("LLM_CACHE_SIZE", "1024")),
+            directory=os.getenv("LLM_CACHE_DIR") or None,
+        )
+        self._inflight: dict[str, _InflightCall] = {}
+
+        # Piper synthesizes in memory and can run several voices in parallel;
+        # pyttsx3 is the fallback but only tolerates one synthesis at a time
+        piper_model = os.getenv("PIPER_MODEL_PATH")
+        self._piper_voice = self._load_piper(piper_model) if piper_model else None
+        self._pyttsx3_lock = threading.Lock()
+        self._tts_engine = None  # created lazily on first pyttsx3 use
+        self._tts_semaphore = asyncio.Semaphore(int(os.getenv("TTS_CONCURRENCY", "3")))
+        # Voicing chunk by chunk means joining the clips with the wave module,
+        # so only do it for engines that write WAV. pyttsx3's macOS driver
+        # writes AIFF; there the merged text is synthesized once instead.
+        self._tts_per_chunk = self._piper_voice is not None or sys.platform != "darwin"
+
+        # Synthesized audio keyed by voice/text, so a translation that was
+        # voiced before (e.g. a cached boilerplate clause) skips TTS too.
+        # Bounded by bytes: a merged-document WAV can run to several MB.
+        self._tts_voice = piper_model if self._piper_voice is not None else "pyttsx3"
+        self.audio_cache = ResultCache(
+            max_bytes=int(os.getenv("TTS_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            directory=os.getenv("TTS_CACHE_DIR") or None,
+        )
+
+        # Private loop for process_text_sync (see there)
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _load_piper(model_path: str):
+        try:
+            from piper import PiperVoice
+        except ImportError:
+            logger.warning("PIPER_MODEL_PATH is set but piper-tts is not installed; using pyttsx3. Run: pip install piper-tts")
+            return None
+        logger.info(f"TTS engine: Piper ({model_path})")
+        return PiperVoice.load(model_path)
+
     def _strip_think_tags(self, text: str) -> str:
         """Remove <think>…</think> reasoning blocks (DeepSeek-R1 etc.)."""
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        if "<think>" not in text:
+            return text.strip()
+        return _THINK_RE.sub("", text).strip()
 
-    def _ask_groq(self, prompt: str) -> str:
-        response = self.groq_client.chat.completions.create(
-            model=self.groq_model,
-            messages=[{"role": "user", "content": prompt}],
+    @_llm_retry
+    async def _ask_groq(self, messages: list[dict], model: str, schema: dict) -> str:
+        response = await self.groq_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            response_format={"type": "json_object"} if self.json_mode else groq.NOT_GIVEN,
         )
         return response.choices[0].message.content
 
-    def _ask_ollama(self, prompt: str) -> str:
-        response = ollama.chat(
-            model=self.ollama_model,
-            messages=[{"role": "user", "content": prompt}],
+    @_llm_retry
+    async def _ask_ollama(self, messages: list[dict], model: str, schema: dict) -> str:
+        response = await self.ollama_client.chat(
+            model=model,
+            messages=messages,
+            format=schema if self.json_mode else None,
+            keep_alive=self.ollama_keep_alive,
         )
         return response["message"]["content"]
 
-    def _parse_llm_response(self, raw: str) -> dict:
+    async def _stream_groq(self, messages: list[dict], model: str, schema: dict) -> AsyncIterator[str]:
+        # Groq's JSON mode cannot be streamed; _parse_llm_response copes with
+        # any prose or fences around the object
+        stream = await self.groq_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+        )
+        async for chunk in stream:
+            yield chunk.choices[0].delta.content or ""
+
+    async def _stream_ollama(self, messages: list[dict], model: str, schema: dict) -> AsyncIterator[str]:
+        stream = await self.ollama_client.chat(
+            model=model,
+            messages=messages,
+            format=schema if self.json_mode else None,
+            keep_alive=self.ollama_keep_alive,
+            stream=True,
+        )
+        async for part in stream:
+            yield part["message"]["content"]
+
+    async def _complete(
+        self,
+        system_prompt: str,
+        input_text: str,
+        model: str,
+        schema: dict,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
+        """One completion from the provider, streamed when `on_delta` is given."""
+        # The instructions go in the system message, identical for every
+        # chunk, so the provider can reuse its cached prefill for them
+        # (Groq prompt caching, Ollama's per-slot KV cache) and only
+        # process the chunk itself
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": input_text},
+        ]
+        async with self._llm_semaphore:
+            if on_delta is not None:
+                raw = await self._collect_stream(messages, model, schema, on_delta)
+            elif self.provider == "groq":
+                raw = await self._ask_groq(messages, model, schema)
+            else:
+                raw = await self._ask_ollama(messages, model, schema)
+        return self._strip_think_tags(raw)
+
+    async def _collect_stream(
+        self, messages: list[dict], model: str, schema: dict, on_delta: Callable[[str], None]
+    ) -> str:
+        """Stream the completion, forwarding each delta, and return the full text."""
+        stream_fn = self._stream_groq if self.provider == "groq" else self._stream_ollama
+        stream = stream_fn(messages, model, schema)
+        parts: list[str] = []
+        async for delta in stream:
+            if delta:
+                parts.append(delta)
+                on_delta(delta)
+        return "".join(parts)
+
+    def _parse_llm_response(self, raw: str) -> tuple[dict, bool]:
         """
         Extract structured data from the LLM's JSON response.
 
-        Returns:
+        Returns (result, parsed_ok), where result is:
             {
                 "simplified_text": str,
                 "red_flags": [
@@ -132,63 +439,155 @@ class SimplyLegal_main:
             }
 
         Falls back to treating the entire response as simplified_text with no
-        red flags if the JSON cannot be parsed.
+        red flags if the JSON cannot be parsed; parsed_ok is then False.
         """
+        for parsed in _json_objects(raw):
+            simplified = str(parsed.get("simplified_text", "")).strip()
+            if simplified:
+                return {
+                    "simplified_text": simplified,
+                    "red_flags":       self._parse_red_flags(parsed.get("red_flags", [])),
+                }, True
+
+        logger.warning("Could not parse structured JSON from LLM; returning raw text, no red flags")
+        return {"simplified_text": raw, "red_flags": []}, False
+
+    def _parse_audit_response(self, raw: str) -> tuple[list[dict], bool]:
+        """
+        Extract the red flags from an audit-pass reply ({"red_flags": [...]}).
+        Returns (red_flags, parsed_ok); an unparseable reply reports no flags.
+        """
+        for parsed in _json_objects(raw):
+            if "red_flags" in parsed:
+                return self._parse_red_flags(parsed["red_flags"]), True
+        logger.warning("Could not parse red flags from the audit reply; reporting none")
+        return [], False
+
+    @staticmethod
+    def _parse_red_flags(raw_flags) -> list[dict]:
+        """Normalize red flags to quote/risk/severity/worst_case, dropping malformed ones."""
         VALID_SEVERITIES = {"high", "medium", "low"}
 
-        # Strip markdown code fences the model sometimes adds
-        cleaned = re.sub(r"```(?:json)?\s*", "", raw).replace("```", "").strip()
+        red_flags = []
+        for f in raw_flags if isinstance(raw_flags, list) else []:
+            if not isinstance(f, dict):
+                continue
+            # Accept both new schema (quote/risk/severity/worst_case)
+            # and old schema (text/risk_level) for backward compatibility
+            quote       = str(f.get("quote") or f.get("text", "")).strip()
+            risk        = str(f.get("risk", "")).strip()
+            severity    = f.get("severity") or f.get("risk_level", "low")
+            worst_case  = str(f.get("worst_case", "")).strip()
 
-        match = re.search(r"\{.*\}", cleaned, re.DOTALL)
-        if match:
-            try:
-                parsed    = json.loads(match.group())
-                simplified = str(parsed.get("simplified_text", "")).strip()
-                raw_flags  = parsed.get("red_flags", [])
-
-                red_flags = []
-                for f in raw_flags:
-                    if not isinstance(f, dict):
-                        continue
-                    # Accept both new schema (quote/risk/severity/worst_case)
-                    # and old schema (text/risk_level) for backward compatibility
-                    quote       = str(f.get("quote") or f.get("text", "")).strip()
-                    risk        = str(f.get("risk", "")).strip()
-                    severity    = f.get("severity") or f.get("risk_level", "low")
-                    worst_case  = str(f.get("worst_case", "")).strip()
-
-                    if not quote:
-                        continue
-                    if severity not in VALID_SEVERITIES:
-                        severity = "low"
-
-                    red_flags.append({
-                        "quote":      quote,
-                        "risk":       risk,
-                        "severity":   severity,
-                        "worst_case": worst_case,
-                    })
-
-                if simplified:
-                    return {"simplified_text": simplified, "red_flags": red_flags}
-            except (json.JSONDecodeError, ValueError):
-                pass
+            if not quote:
+                continue
+            if severity not in VALID_SEVERITIES:
+                severity = "low"
 
-        logger.warning("Could not parse structured JSON from LLM; returning raw text, no red flags")
-        return {"simplified_text": raw, "red_flags": []}
+            red_flags.append({
+                "quote":      quote,
+                "risk":       risk,
+                "severity":   severity,
+                "worst_case": worst_case,
+            })
+        return red_flags
+
+    def _cache_key(self, input_text: str) -> str:
+        if self.split_passes:
+            parts = (self.simplify_model, self.audit_model, _SIMPLIFY_PROMPT, _AUDIT_PROMPT)
+        else:
+            parts = (self.simplify_model, self.system_prompt)
+        return self.cache.make_key(self.provider, *parts, input_text)
 
-    def _ask_and_parse(self, input_text: str) -> dict:
+    async def _ask_and_parse(
+        self,
+        input_text: str,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict:
         """
         Call the LLM and return a parsed dict:
             { "simplified_text": str, "red_flags": [...] }
+
+        `on_delta`, if given, receives the raw model output as it is
+        generated, including output produced before this caller joined an
+        in-flight request. Cache hits return without any deltas.
         """
+        cache_key = self._cache_key(input_text)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("LLM cache hit")
+            return cached
+
+        # Concurrent requests for the same chunk share one LLM call instead
+        # of each paying for their own round-trip
+        call = self._inflight.get(cache_key)
+        if call is not None and on_delta is not None and not call.streaming:
+            # A non-streaming call has no deltas to share; run our own
+            return await self._call_llm(input_text, cache_key, on_delta)
+        if call is None:
+            call = _InflightCall(streaming=on_delta is not None)
+            call.task = asyncio.ensure_future(
+                self._call_llm(input_text, cache_key, call.publish if call.streaming else None)
+            )
+            self._inflight[cache_key] = call
+            call.task.add_done_callback(lambda _: self._forget_inflight(cache_key, call))
+        else:
+            logger.info("Joining in-flight LLM request for identical chunk")
+
+        if on_delta is not None:
+            call.subscribe(on_delta)
+        call.waiters += 1
+        try:
+            # shield() so one caller disconnecting does not cancel the others
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if on_delta is not None:
+                call.listeners.remove(on_delta)
+            if call.waiters == 0 and not call.task.done():
+                # The last caller is gone: stop the LLM call rather than
+                # spend it (and its semaphore slot) on a reply nobody reads
+                self._forget_inflight(cache_key, call)
+                call.task.cancel()
+
+    def _forget_inflight(self, cache_key: str, call: "_InflightCall") -> None:
+        if self._inflight.get(cache_key) is call:
+            del self._inflight[cache_key]
+
+    async def _call_llm(
+        self,
+        input_text: str,
+        cache_key: str,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> dict:
+        """Send one chunk to the provider, parse the reply and cache it."""
         self.is_busy = True
         try:
             logger.info(f"Sending request via {self.provider}")
-            prompt = f"{self.system_prompt}\n\n:: Input text:\n{input_text}"
-            raw = self._ask_groq(prompt) if self.provider == "groq" else self._ask_ollama(prompt)
-            raw = self._strip_think_tags(raw)
-            result = self._parse_llm_response(raw)
+            if self.split_passes:
+                # Only the simplify pass is streamed: its deltas carry the text
+                simplify_raw, audit_raw = await asyncio.gather(
+                    self._complete(
+                        _SIMPLIFY_PROMPT, input_text, self.simplify_model, _SIMPLIFY_SCHEMA, on_delta
+                    ),
+                    self._complete(_AUDIT_PROMPT, input_text, self.audit_model, _AUDIT_SCHEMA),
+                )
+                simplified, simplify_ok = self._parse_llm_response(simplify_raw)
+                red_flags, audit_ok = self._parse_audit_response(audit_raw)
+                result = {
+                    "simplified_text": simplified["simplified_text"],
+                    "red_flags":       red_flags,
+                }
+                parsed_ok = simplify_ok and audit_ok
+            else:
+                raw = await self._complete(
+                    self.system_prompt, input_text, self.simplify_model, _RESPONSE_SCHEMA, on_delta
+                )
+                result, parsed_ok = self._parse_llm_response(raw)
+            # A fallback result is still returned, but not cached: the next
+            # request for this chunk gets a fresh chance at a parseable reply
+            if parsed_ok:
+                self.cache.set(cache_key, result)
             logger.info(
                 f"LLM response parsed — "
                 f"{len(result['red_flags'])} red flag(s) found"
@@ -205,38 +604,115 @@ class SimplyLegal_main:
         finally:
             self.is_busy = False
 
+    def _tts_piper(self, text: str) -> bytes:
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav_file:
+            self._piper_voice.synthesize_wav(text, wav_file)
+        return buf.getvalue()
+
+    def _tts_pyttsx3(self, text: str) -> bytes:
+        with tempfile.TemporaryDirectory(dir=_TTS_TMP_DIR) as tmp_dir:
+            path = os.path.join(tmp_dir, "speech.wav")
+            if not _TTS_USE_FIFO:
+                self._run_pyttsx3(text, path)
+                with open(path, "rb") as f:
+                    return f.read()
+
+            os.mkfifo(path)
+            # Open both ends up front: the engine's open() then never blocks,
+            # and our own write end keeps the reader from seeing EOF before
+            # the engine has connected (or if it fails without writing)
+            read_fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            hold_fd = os.open(path, os.O_WRONLY)
+            os.set_blocking(read_fd, True)
+
+            received: list[bytes] = []
+            reader = threading.Thread(target=_drain_fd, args=(read_fd, received), daemon=True)
+            reader.start()
+            try:
+                self._run_pyttsx3(text, path)
+            finally:
+                os.close(hold_fd)
+                reader.join()
+            if not received or not received[0]:
+                raise RuntimeError("pyttsx3 produced no audio")
+            return received[0]
+
+    def _run_pyttsx3(self, text: str, path: str) -> None:
+        # pyttsx3 drivers are process-global; concurrent runAndWait()
+        # calls deadlock, so synthesis is serialized. The engine is
+        # initialized once: loading the speech driver is the slow part.
+        with self._pyttsx3_lock:
+            if self._tts_engine is None:
+                self._tts_engine = pyttsx3.init()
+            self._tts_engine.save_to_file(text, path)
+            self._tts_engine.runAndWait()
+
+    async def _speak(self, text: str) -> bytes:
+        """Synthesize text in a worker thread (bounded by TTS_CONCURRENCY), or reuse cached audio."""
+        cache_key = self.audio_cache.make_key(self._tts_voice, text)
+        cached = self.audio_cache.get(cache_key)
+        if cached is not None:
+            logger.info("TTS cache hit")
+            return cached
+
+        async with self._tts_semaphore:
+            audio = await asyncio.to_thread(self.tts_to_bytes, text)
+        self.audio_cache.set(cache_key, audio)
+        return audio
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    async def warmup(self) -> None:
+        """
+        Load the Ollama model into memory ahead of the first request, which
+        would otherwise pay the multi-second load. No-op for Groq.
+        """
+        if self.provider != "ollama":
+            return
+        for model in dict.fromkeys((self.simplify_model, self.audit_model)):
+            try:
+                # An empty prompt makes Ollama load the model without generating
+                await self.ollama_client.generate(
+                    model=model, prompt="", keep_alive=self.ollama_keep_alive
+                )
+                logger.info(f"Ollama model {model} loaded")
+            except Exception as e:
+                logger.warning(f"Could not preload Ollama model {model}: {e}")
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections of whichever provider is in use."""
+        if self._http is not None:
+            await self._http.aclose()
+
     def tts_to_bytes(self, text: str) -> bytes:
         """Convert text to WAV audio bytes."""
         if not text or not text.strip():
             raise ValueError("Cannot generate audio from empty text")
 
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-        temp_file.close()
         try:
             logger.info("Generating audio from text")
-            engine = pyttsx3.init()          # fresh instance every call
-            engine.save_to_file(text, temp_file.name)
-            engine.runAndWait()
-            engine.stop()                    # cleanly tear down the event loop
-            with open(temp_file.name, "rb") as f:
-                audio_bytes = f.read()
+            if self._piper_voice is not None:
+                audio_bytes = self._tts_piper(text)
+            else:
+                audio_bytes = self._tts_pyttsx3(text)
             logger.info(f"Audio generated successfully ({len(audio_bytes)} bytes)")
             return audio_bytes
         except Exception as e:
             logger.error(f"Error generating audio: {e}")
             raise Exception(f"Failed to generate audio: {str(e)}")
-        finally:
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
 
-    def process_text(self, input_text: str) -> dict:
+    async def process_text(self, input_text: str) -> dict:
         """
         Chunk → translate (with red-flag detection) → merge → TTS.
 
+        Chunks are translated concurrently (bounded by LLM_CONCURRENCY) and
+        merged back in their original order. Each chunk's audio is synthesized
+        as soon as its translation lands and the clips are joined in order
+        (except pyttsx3 on macOS, which voices the merged text once).
+
         Returns:
             {
                 "text":             str,
@@ -251,23 +727,41 @@ class SimplyLegal_main:
 
 
         chunks = self.chunker.chunk_text(input_text)
-        logger.info(f"Processing {len(chunks)} chunk(s)")
-
-        simplified_parts: list[str] = []
-        all_red_flags:    list[dict] = []
+        # Repeated boilerplate is translated (and voiced) once, then
+        # scattered back into every position it appears in
+        keys, first_by_key = _unique_chunks(chunks)
+        unique = list(first_by_key.values())
+        logger.info(f"Processing {len(chunks)} chunk(s), {len(unique)} unique")
 
-        for i, chunk in enumerate(chunks, 1):
-            logger.info(f"Processing chunk {i}/{len(chunks)} ({len(chunk)} chars)")
+        async def translate(i: int, chunk: str) -> tuple[dict, bytes | None]:
+            logger.info(f"Processing chunk {i}/{len(unique)} ({len(chunk)} chars)")
             try:
-                result = self._ask_and_parse(chunk)
-                simplified_parts.append(result["simplified_text"])
-                all_red_flags.extend(result["red_flags"])
+                result = await self._ask_and_parse(chunk)
             except Exception as e:
                 logger.error(f"Error on chunk {i}: {e}")
                 raise
+            # Voice each chunk as soon as it is translated so TTS overlaps
+            # with the chunks still waiting on the LLM
+            text = result["simplified_text"]
+            audio = await self._speak(text) if self._tts_per_chunk and text.strip() else None
+            return result, audio
+
+        # gather() preserves submission order, so results line up with unique
+        unique_pairs = await asyncio.gather(
+            *(translate(i, chunk) for i, chunk in enumerate(unique, 1))
+        )
+        pairs_by_key = dict(zip(first_by_key, unique_pairs))
+        pairs = [pairs_by_key[key] for key in keys]
+        results = [result for result, _ in pairs]
+
+        simplified_parts: list[str] = [r["simplified_text"] for r in results]
+        all_red_flags:    list[dict] = [f for r in results for f in r["red_flags"]]
 
         simplified_text = self.chunker.merge_chunks(simplified_parts)
-        audio_bytes     = self.tts_to_bytes(simplified_text)
+        if self._tts_per_chunk:
+            audio_bytes = _concat_wav([audio for _, audio in pairs if audio is not None])
+        else:
+            audio_bytes = await self._speak(simplified_text)
 
         return {
             "text":             simplified_text,
@@ -276,5 +770,284 @@ class SimplyLegal_main:
             "chunks_processed": len(chunks),
         }
 
+    def process_text_sync(self, input_text: str) -> dict:
+        """
+        Blocking wrapper around process_text for scripts and other callers
+        without an event loop.
+
+        The semaphores and pooled HTTP connections are tied to the loop they
+        were first used on, so every call runs on the same private loop
+        rather than a fresh asyncio.run() loop. Don't mix this with awaiting
+        process_text on the same instance.
+        """
+        if self._sync_loop is None:
+            self._sync_loop = asyncio.new_event_loop()
+        return self._sync_loop.run_until_complete(self.process_text(input_text))
+
+    async def stream_text(self, input_text: str) -> AsyncIterator[dict]:
+        """
+        Streaming variant of process_text. Yields events as they happen:
+
+            { "type": "delta", "index": int, "content": str }
+                raw model output for chunk `index` as it is generated
+            { "type": "text", "index": int, "content": str }
+                the decoded simplified_text of chunk `index` as it is generated
+            { "type": "chunk", "index": int, "simplified_text": str, "red_flags": [...] }
+                parsed result once chunk `index` is complete
+            { "type": "done", "text": str, "red_flags": [...], "audio": bytes, "chunks_processed": int }
+                merged result and audio, always last
+
+        Chunks run concurrently, so events for different chunks interleave.
+        A repeated chunk is translated once: its deltas are reported under
+        its first index only, its "chunk" event under every index.
+        """
+        chunks = self.chunker.chunk_text(input_text)
+        keys, first_by_key = _unique_chunks(chunks)
+        logger.info(f"Streaming {len(chunks)} chunk(s), {len(first_by_key)} unique")
+
+        indices_by_key: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            indices_by_key.setdefault(key, []).append(i)
+
+        queue: asyncio.Queue[dict | None] = asyncio.Queue()
+        results: list[dict] = [{}] * len(chunks)
+        audio_by_key: dict[str, bytes] = {}
+
+        async def translate(key: str, chunk: str) -> None:
+            i = indices_by_key[key][0]
+            text_field = _TextFieldStream()
+
+            def on_delta(content: str) -> None:
+                queue.put_nowait({"type": "delta", "index": i, "content": content})
+                if text := text_field.feed(content):
+                    queue.put_nowait({"type": "text", "index": i, "content": text})
+
+            result = await self._ask_and_parse(chunk, on_delta)
+            for j in indices_by_key[key]:
+                results[j] = result
+                queue.put_nowait({"type": "chunk", "index": j, **result})
+            # Voice the chunk now, while later chunks are still streaming
+            text = result["simplified_text"]
+            if self._tts_per_chunk and text.strip():
+                audio_by_key[key] = await self._speak(text)
+
+        tasks = [asyncio.ensure_future(translate(key, chunk)) for key, chunk in first_by_key.items()]
+        worker = asyncio.gather(*tasks)
+
+        def finished(future: asyncio.Future) -> None:
+            queue.put_nowait(None)
+            # If the client went away, nobody awaits the gather; mark its
+            # CancelledError as retrieved so asyncio does not log it
+            if not future.cancelled():
+                future.exception()
+
+        worker.add_done_callback(finished)
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            await worker  # re-raise the first chunk error, if any
+        finally:
+            # gather() leaves the other chunks running after one fails (and
+            # when the client goes away), so stop each of them explicitly
+            for task in tasks:
+                task.cancel()
+
+        simplified_parts = [r["simplified_text"] for r in results]
+        simplified_text  = self.chunker.merge_chunks(simplified_parts)
+        if self._tts_per_chunk:
+            audio_bytes = _concat_wav([audio_by_key[key] for key in keys if key in audio_by_key])
+        else:
+            audio_bytes = await self._speak(simplified_text)
+
+        yield {
+            "type":             "done",
+            "text":             simplified_text,
+            "red_flags":        [f for r in results for f in r["red_flags"]],
+            "audio":            audio_bytes,
+            "chunks_processed": len(chunks),
+        }
+
+
+def _unique_chunks(chunks: list[str]) -> tuple[list[str], dict[str, str]]:
+    """
+    Dedupe key of each chunk, and the first chunk seen for each key. Chunks
+    that differ only in whitespace (line wrapping, indentation) share a key.
+    """
+    keys = [" ".join(chunk.split()) for chunk in chunks]
+    first_by_key: dict[str, str] = {}
+    for key, chunk in zip(keys, chunks):
+        first_by_key.setdefault(key, chunk)
+    return keys, first_by_key
+
+
+def _json_objects(raw: str) -> Iterator[dict]:
+    """Each JSON object found in an LLM reply, most likely first."""
+    for candidate in _json_candidates(raw):
+        try:
+            parsed = _json_loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            yield parsed
+
+
+def _json_candidates(raw: str) -> Iterator[str]:
+    """
+    Texts to try parsing as the response object, most likely first.
+
+    In JSON mode the reply is the object itself. Otherwise the model may
+    wrap it in markdown fences or prose, or emit several objects, so each
+    {...} block is tried in turn.
+    """
+    yield raw
+    yield from _iter_json_objects(_FENCE_RE.sub("", raw).replace("```", ""))
+
+
+def _iter_json_objects(text: str) -> Iterator[str]:
+    """
+    Yield each top-level {...} block in text, in order.
+
+    A linear scan that matches braces by depth and skips over string
+    literals (honouring backslash escapes), so braces inside JSON strings
+    or between separate objects do not confuse it. A "{" that is never
+    closed (e.g. in prose before the real object) is skipped and the scan
+    resumes right after it.
+    """
+    pos = 0
+    while (start := text.find("{", pos)) >= 0:
+        depth = 0
+        in_string = escaped = False
+        for i in range(start, len(text)):
+            ch = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            pos = start + 1  # unbalanced to the end of the text
+            continue
+        yield text[start:i + 1]
+        pos = i + 1
+
+
+class _TextFieldStream:
+    """
+    Incrementally decodes the "simplified_text" string of a JSON reply that
+    arrives in pieces, so the plain-language text can be shown while the
+    model is still writing it (and the red flags after it).
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos: int | None = None  # next undecoded index inside the value
+        self.done = False
+
+    def feed(self, delta: str) -> str:
+        """Add raw model output; return the newly completed part of the field."""
+        if self.done:
+            return ""
+        self._buf += delta
+        if self._pos is None:
+            match = _TEXT_FIELD_RE.search(self._buf)
+            if match is None:
+                return ""
+            self._pos = match.end()
+
+        buf, start = self._buf, self._pos
+        i = start
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self.done = True
+                break
+            if ch == "\\":
+                width = _escape_width(buf, i)
+                if i + width > len(buf):
+                    break  # escape split across deltas; wait for the rest
+                i += width
+            else:
+                i += 1
+        self._pos = i
+
+        segment = buf[start:i]
+        if "\\" not in segment:
+            return segment
+        try:
+            return _json_loads(f'"{segment}"')
+        except ValueError:
+            return segment
+
+
+def _escape_width(s: str, i: int) -> int:
+    """Length of the JSON escape sequence starting at s[i] (a backslash)."""
+    if s[i + 1:i + 2] != "u":
+        return 2
+    try:
+        code = int(s[i + 2:i + 6], 16)
+    except ValueError:
+        return 6
+    # A high surrogate is only decodable together with its low surrogate
+    if 0xD800 <= code <= 0xDBFF and s[i + 6:i + 8] in ("\\u", "\\", ""):
+        return 12
+    return 6
+
+
+class _InflightCall:
+    """
+    One LLM call shared by every caller asking for the same chunk at once.
+    Streamed output is fanned out to each caller's on_delta, and replayed
+    to callers that join part-way through.
+    """
+
+    def __init__(self, streaming: bool):
+        self.streaming = streaming
+        self.task: asyncio.Future | None = None
+        self.listeners: list[Callable[[str], None]] = []
+        self.waiters = 0
+        self._deltas: list[str] = []
+
+    def subscribe(self, on_delta: Callable[[str], None]) -> None:
+        for delta in self._deltas:
+            on_delta(delta)
+        self.listeners.append(on_delta)
+
+    def publish(self, delta: str) -> None:
+        self._deltas.append(delta)
+        for on_delta in self.listeners:
+            on_delta(delta)
+
+
+def _drain_fd(fd: int, out: list[bytes]) -> None:
+    """Read a pipe until every writer has closed it."""
+    with os.fdopen(fd, "rb") as f:
+        out.append(f.read())
+
+
+def _concat_wav(segments: list[bytes]) -> bytes:
+    """Join WAV clips that share one audio format into a single WAV file."""
+    if not segments:
+        raise ValueError("Cannot generate audio from empty text")
+    if len(segments) == 1:
+        return segments[0]
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as out:
+        for i, segment in enumerate(segments):
+            with wave.open(io.BytesIO(segment), "rb") as clip:
+                if i == 0:
+                    out.setparams(clip.getparams())
+                out.writeframes(clip.readframes(clip.getnframes()))
+    return buf.getvalue()
+
 
 # process_text() -- ask_and_parse() -- _ask_groq()/_ask_ollama() -- _parse_llm_response()
@@ -0,0 +1,82 @@
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Content-addressed cache for expensive results (LLM translations, audio).
+
+    Entries live in an in-process LRU; when a directory is given and
+    `diskcache` is installed, they are also persisted there so they survive
+    restarts and are shared between worker processes.
+
+    The LRU holds at most `maxsize` entries. For bytes values (audio), pass
+    `max_bytes` instead to bound it, and the disk cache, by total size.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        directory: str | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._used = 0  # entries, or bytes with max_bytes
+        self._disk = None
+
+        if directory:
+            try:
+                import diskcache
+            except ImportError:
+                logger.warning("diskcache not installed; using in-memory cache only. Run: pip install diskcache")
+            else:
+                if max_bytes is None:
+                    self._disk = diskcache.Cache(directory)
+                else:
+                    self._disk = diskcache.Cache(directory, size_limit=max_bytes)
+                logger.info(f"Persistent cache enabled at {directory}")
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the given parts into a fixed-size key."""
+        return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._remember(key, value)
+                return value
+
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value)
+
+    def _remember(self, key: str, value: Any) -> None:
+        limit = self.maxsize if self.max_bytes is None else self.max_bytes
+        size = self._size(value)
+        if size > limit:
+            return
+        if key in self._memory:
+            self._used -= self._size(self._memory.pop(key))
+        self._memory[key] = value
+        self._used += size
+        while self._used > limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._used -= self._size(evicted)
+
+    def _size(self, value: Any) -> int:
+        return 1 if self.max_bytes is None else len(value)
@@ -1,16 +1,35 @@
 import logging
 import os
 import re
+from collections.abc import Iterator
 
 logger = logging.getLogger(__name__)
 
+_MAX_CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "1000"))
+_ENABLE_CHUNKING = os.getenv("ENABLE_CHUNKING", "true").lower() == "true"
+
+_PARA_SPLIT = re.compile(r"\n\n+")
+# Sentence-ending punctuation and the whitespace after it
+_SENT_END = re.compile(r"[.!?]\s+")
+
+
+def _split_sentences(text: str) -> Iterator[str]:
+    """Split after sentence-ending punctuation, keeping it with the sentence."""
+    # finditer + slicing rather than a lookbehind split: one forward scan,
+    # and sentences are produced lazily instead of as a list
+    start = 0
+    for match in _SENT_END.finditer(text):
+        yield text[start:match.start() + 1]
+        start = match.end()
+    yield text[start:]
+
 
 class TextChunker:
     """Intelligently splits long text into meaningful chunks for LLM processing."""
 
     def __init__(self):
-        self.max_chunk_size = int(os.getenv("CHUNK_SIZE", "1000"))
-        self.enable_chunking = os.getenv("ENABLE_CHUNKING", "true").lower() == "true"
+        self.max_chunk_size = _MAX_CHUNK_SIZE
+        self.enable_chunking = _ENABLE_CHUNKING
 
     def chunk_text(self, text: str) -> list[str]:
         """
@@ -27,62 +46,59 @@ class TextChunker:
 
         logger.info(f"Text length ({len(text)}) exceeds max chunk size ({self.max_chunk_size}). Chunking enabled.")
 
-        # First, try splitting by paragraphs (double newlines)
-        chunks = self._chunk_by_paragraphs(text)
-
-        # If paragraphs are still too large, split by sentences
-        chunks = self._chunk_by_sentences(chunks)
-
-        logger.info(f"Text split into {len(chunks)} chunks")
-        return chunks
-
-    def _chunk_by_paragraphs(self, text: str) -> list[str]:
-        """Split text by paragraphs (double newlines or more)."""
-        # Split by double+ newlines
-        paragraphs = re.split(r"\n\n+", text.strip())
         chunks = []
-
-        for para in paragraphs:
+        # Consecutive small paragraphs are packed into one chunk, so short
+        # paragraphs do not each cost a separate LLM round-trip
+        current: list[str] = []
+        current_len = 0
+        for para in _PARA_SPLIT.split(text.strip()):
             para = para.strip()
             if not para:
                 continue
-            if len(para) <= self.max_chunk_size:
-                chunks.append(para)
-            else:
-                # Paragraph is too large, will be handled by sentence splitting
-                chunks.append(para)
 
+            if len(para) > self.max_chunk_size:
+                # Paragraph is too large, split it by sentences
+                if current:
+                    chunks.append("\n\n".join(current))
+                    current, current_len = [], 0
+                chunks.extend(self._chunk_by_sentences(para))
+                continue
+
+            if current and current_len + 2 + len(para) > self.max_chunk_size:
+                chunks.append("\n\n".join(current))
+                current, current_len = [], 0
+            current_len += len(para) + (2 if current else 0)
+            current.append(para)
+
+        if current:
+            chunks.append("\n\n".join(current))
+
+        logger.info(f"Text split into {len(chunks)} chunks")
         return chunks
 
-    def _chunk_by_sentences(self, chunks: list[str]) -> list[str]:
-        """Further split oversized chunks by sentences."""
-        final_chunks = []
+    def _chunk_by_sentences(self, para: str) -> list[str]:
+        """Pack the sentences of an oversized paragraph into chunks."""
+        chunks = []
 
-        for chunk in chunks:
-            if len(chunk) <= self.max_chunk_size:
-                final_chunks.append(chunk)
+        current_chunk = ""
+        # Split by sentences (periods, exclamation marks, question marks)
+        for sentence in _split_sentences(para):
+            if len(current_chunk) + len(sentence) + 1 <= self.max_chunk_size:
+                if current_chunk:
+                    current_chunk += " " + sentence
+                else:
+                    current_chunk = sentence
             else:
-                # Split by sentences (periods, exclamation marks, question marks)
-                # This regex tries to preserve sentence boundaries
-                sentences = re.split(r'(?<=[.!?])\s+', chunk)
-
-                current_chunk = ""
-                for sentence in sentences:
-                    if len(current_chunk) + len(sentence) + 1 <= self.max_chunk_size:
-                        if current_chunk:
-                            current_chunk += " " + sentence
-                        else:
-                            current_chunk = sentence
-                    else:
-                        if current_chunk:
-                            final_chunks.append(current_chunk)
-                        current_chunk = sentence
-
                 if current_chunk:
-                    final_chunks.append(current_chunk)
+                    chunks.append(current_chunk)
+                current_chunk = sentence
 
-        return final_chunks
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        return chunks
 
     def merge_chunks(self, chunks: list[str], separator: str = "\n\n") -> str:
         """Merge processed chunks back together."""
-        return separator.join(chunk.strip() for chunk in chunks if chunk.strip())
+        stripped = (chunk.strip() for chunk in chunks)
+        return separator.join(chunk for chunk in stripped if chunk)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the LLM reply parsing and audio helpers.
+Run with: pytest test_llm_parsing.py
+"""
+
+import io
+import json
+import wave
+
+import pytest
+
+from services.llm_tts import _concat_wav, _escape_width, _iter_json_objects, _TextFieldStream
+
+
+def _wav(frames: bytes, rate: int = 16000) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+    return buf.getvalue()
+
+
+def test_iter_json_objects_separate_blocks():
+    text = 'say {"a": "}{\\""} and {"b": {"c": 1}} then'
+    assert list(_iter_json_objects(text)) == ['{"a": "}{\\""}', '{"b": {"c": 1}}']
+
+
+def test_iter_json_objects_skips_unbalanced_brace():
+    """An unclosed "{" in prose must not hide the object after it."""
+    assert list(_iter_json_objects('prose { then {"simplified_text": "x"}')) == [
+        '{"simplified_text": "x"}'
+    ]
+    assert list(_iter_json_objects("{ never closed")) == []
+
+
+@pytest.mark.parametrize("text", [
+    "plain words",
+    'quote \\" and newline \\n and tab \\t',
+    "accent \\u00e9 and emoji \\ud83d\\ude00 end",
+])
+def test_text_field_stream_any_split(text):
+    """The decoded field is the same however the reply is split into deltas."""
+    reply = f'{{"simplified_text": "{text}", "red_flags": []}}'
+    expected = json.loads(f'"{text}"')
+    for cut in range(1, len(reply)):
+        stream = _TextFieldStream()
+        out = stream.feed(reply[:cut]) + stream.feed(reply[cut:])
+        assert out == expected
+        assert stream.done
+
+
+def test_escape_width():
+    assert _escape_width('\\n', 0) == 2
+    assert _escape_width('\\u00e9', 0) == 6
+    assert _escape_width('\\ud83d\\ude00', 0) == 12
+    # A high surrogate whose partner has not arrived yet waits for it
+    assert _escape_width('\\ud83d', 0) == 12
+
+
+def test_concat_wav():
+    first, second = b"\x01\x00" * 10, b"\x02\x00" * 5
+    joined = _concat_wav([_wav(first), _wav(second)])
+    with wave.open(io.BytesIO(joined), "rb") as w:
+        assert w.getframerate() == 16000
+        assert w.readframes(w.getnframes()) == first + second
+    single = _wav(first)
+    assert _concat_wav([single]) is single
+    with pytest.raises(ValueError):
+        _concat_wav([])
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the result cache.
+Run with: pytest test_result_cache.py
+"""
+
+from services.result_cache import ResultCache
+
+
+def test_lru_by_entry_count():
+    cache = ResultCache(maxsize=2)
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    cache.get("a")  # a is now the most recently used
+    cache.set("c", {"n": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.get("c") == {"n": 3}
+
+
+def test_lru_by_total_bytes():
+    cache = ResultCache(max_bytes=10)
+    cache.set("a", b"x" * 4)
+    cache.set("b", b"y" * 4)
+    cache.set("a", b"z" * 6)  # replacing an entry does not count it twice
+    assert cache.get("b") == b"y" * 4
+    cache.set("c", b"w" * 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"y" * 4
+    assert cache.get("c") == b"w" * 3
+    # Larger than the whole budget: not kept, and nothing else is evicted
+    cache.set("big", b"q" * 11)
+    assert cache.get("big") is None
+    assert cache.get("b") is not None
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the upload text extraction.
+Run with: pytest test_upload.py
+"""
+
+import io
+import zipfile
+
+from routers.upload import _extract_docx
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+WPS_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+
+
+def _docx(body: str) -> bytes:
+    xml = (
+        f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}" xmlns:wps="{WPS_NS}">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr("word/document.xml", xml)
+    return buf.getvalue()
+
+
+def _para(text: str) -> str:
+    return f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def test_docx_paragraphs_and_tables():
+    body = (
+        _para("First clause.")
+        + '<w:p><w:hyperlink><w:r><w:t>Linked</w:t></w:r></w:hyperlink>'
+        + '<w:r><w:tab/><w:t xml:space="preserve"> text.</w:t></w:r></w:p>'
+        + f"<w:tbl><w:tr><w:tc>{_para('Cell.')}</w:tc></w:tr></w:tbl>"
+    )
+    assert _extract_docx(_docx(body)) == "First clause.\n\nLinked\t text.\n\nCell."
+
+
+def test_docx_text_box_is_not_duplicated():
+    """A text box's text is its own paragraph, and the mc:Fallback copy is skipped."""
+    box = f"<w:txbxContent>{_para('Box clause.')}</w:txbxContent>"
+    body = (
+        _para("Intro.")
+        + "<w:p><w:r><w:t>Anchor para.</w:t></w:r><w:r><mc:AlternateContent>"
+        + f"<mc:Choice><w:drawing><wps:txbx>{box}</wps:txbx></w:drawing></mc:Choice>"
+        + f"<mc:Fallback><w:pict>{box}</w:pict></mc:Fallback>"
+        + "</mc:AlternateContent></w:r></w:p>"
+    )
+    assert _extract_docx(_docx(body)) == "Intro.\n\nAnchor para.\n\nBox clause."
+
+
+def test_upload_rejects_oversized_request_before_parsing():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from routers import upload
+
+    app = FastAPI()
+    app.include_router(upload.router)
+    client = TestClient(app)
+
+    ok = client.post("/api/upload", files={"file": ("a.txt", b"Short clause.")})
+    assert ok.status_code == 200
+    assert ok.json()["text"] == "Short clause."
+
+    too_big = client.post(
+        "/api/upload",
+        content=b"x" * 16,
+        headers={
+            "content-type": "multipart/form-data; boundary=b",
+            "content-length": str(upload._MAX_REQUEST_SIZE + 1),
+        },
+    )
+    assert too_big.status_code == 413
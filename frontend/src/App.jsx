@@ -303,7 +303,7 @@ function App() {
       }
 
       startTyping(translatedText);
-      setAudioData(data.audio ?? null);
+      setAudioData(data.audio_id ? `${API_URL}/audio/${data.audio_id}` : null);
       setRedFlags(translatedFlags);
     } catch (error) {
       setApiError(error.message); stopTyping(); setOutputText("");
@@ -388,13 +388,9 @@ function App() {
 
     if (audioData) {
       try {
-        const binary = atob(audioData);
-        const bytes = new Uint8Array(binary.length);
-        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
-        const url = URL.createObjectURL(new Blob([bytes], { type: "audio/wav" }));
-        const audio = new Audio(url);
+        const audio = new Audio(audioData);
         audioRef.current = audio;
-        audio.onended = () => { URL.revokeObjectURL(url); setAudioStatus("idle"); };
+        audio.onended = () => setAudioStatus("idle");
         await audio.play();
         return;
       } catch (e) { setAudioStatus("error"); }